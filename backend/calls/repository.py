@@ -1,33 +1,25 @@
 from calls.schemas import CallCreate
 from core.database import get_pool
-from datetime import datetime
+from datetime import date
 from typing import Optional
 
 async def create_call(call: CallCreate) -> int:
     """
-    Insert a new call row when an outbound call is initiated.
+    Insert a new call row when a session starts, including its session ID,
+    in a single round-trip.
     Returns the new call ID.
     """
     pool = await get_pool()
 
     async with pool.acquire() as conn:
         row = await conn.fetchrow("""
-            INSERT INTO calls (phone_number, amount_owed, status, customer_id, customer_name)
-            VALUES ($1, $2, 'initiated', $3, $4)
+            INSERT INTO calls (phone_number, amount_owed, status, customer_id, customer_name, call_sid)
+            VALUES ($1, $2, 'initiated', $3, $4, $5)
             RETURNING id
-        """, call.phone_number, call.amount_owed, call.customer_id, call.customer_name)
+        """, call.phone_number, call.amount_owed, call.customer_id, call.customer_name, call.call_sid)
         return row['id']
 
 
-async def update_call_sid(call_id: int, call_sid: str) -> None:
-    """Attach Twilio's call SID once we have it."""
-    pool = await get_pool()
-    async with pool.acquire() as conn:
-        await conn.execute("""
-            UPDATE calls SET call_sid = $1 WHERE id = $2
-        """, call_sid, call_id)
-
-
 async def complete_call(
     call_id: int,
     outcome: str,                        # promise_made | refused | no_commitment
@@ -51,23 +43,34 @@ async def complete_call(
                 duration_seconds = $3,
                 promise_date     = $4,
                 promise_amount   = $5,
-                completed_at     = $6
-            WHERE id = $7
+                completed_at     = now()
+            WHERE id = $6
         """,
             outcome,
             transcript,
             duration_seconds,
-            datetime.strptime(promise_date, "%Y-%m-%d").date() if promise_date else None,
+            date.fromisoformat(promise_date) if promise_date else None,
             promise_amount,
-            datetime.utcnow(),
             call_id,
         )
 
 
-async def get_all_calls() -> list[dict]:
-    """Retrieve all calls ordered by most recent first."""
+async def get_all_calls(limit: Optional[int] = None, before_id: Optional[int] = None) -> list[dict] | None:
+    """
+    Retrieve calls, most recent first — all of them by default.
+    Paging is opt-in: pass `limit` for a page size, and the last id of the
+    previous page as `before_id` to get the next one (keyset, so deep pages
+    don't re-scan skipped rows the way OFFSET does).
+    Returns None if `before_id` is not an existing call.
+    """
     pool = await get_pool()
     async with pool.acquire() as conn:
+        cursor_at = None
+        if before_id is not None:
+            cursor_at = await conn.fetchval("SELECT initiated_at FROM calls WHERE id = $1", before_id)
+            if cursor_at is None:
+                return None
+
         rows = await conn.fetch("""
             SELECT
                 id, call_sid, phone_number, status, outcome,
@@ -75,6 +78,9 @@ async def get_all_calls() -> list[dict]:
                 transcript, duration_seconds, initiated_at, completed_at,
                 customer_id, customer_name
             FROM calls
-            ORDER BY initiated_at DESC
-        """)
+            WHERE $2::int IS NULL
+               OR (initiated_at, id) < ($3::timestamptz, $2::int)
+            ORDER BY initiated_at DESC, id DESC
+            LIMIT $1
+        """, limit, before_id, cursor_at)
         return [dict(row) for row in rows]
@@ -1,10 +1,17 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query
 from calls.repository import get_all_calls
 from calls.schemas import CallResponse
 
 router = APIRouter(prefix="/api/calls", tags=["calls"])
 
 @router.get("", response_model=list[CallResponse])
-async def get_calls():
-    """Retrieve all call logs for the dashboard."""
-    return await get_all_calls()
+async def get_calls(
+    limit: int | None = Query(None, ge=1, le=500, description="page size; omit for the full history"),
+    cursor: int | None = Query(None, description="id of the last call on the previous page"),
+):
+    """Retrieve call logs for the dashboard, newest first. Returns the full
+    history unless `limit` is given, in which case it pages via `cursor`."""
+    calls = await get_all_calls(limit=limit, before_id=cursor)
+    if calls is None:
+        raise HTTPException(status_code=400, detail="Unknown cursor")
+    return calls
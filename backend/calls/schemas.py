@@ -9,7 +9,7 @@ class CallBase(BaseModel):
     customer_name: Optional[str] = None
 
 class CallCreate(CallBase):
-    pass
+    call_sid: str | None = None
 
 class CallResponse(CallBase):
     id: int
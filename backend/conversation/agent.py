@@ -1,13 +1,31 @@
+import logging
 import os
-import json
-import traceback
 from datetime import timedelta
+import httpx
+import orjson
 from anthropic import AsyncAnthropic
+from core.http_client import sdk_client
 from conversation.prompts import get_agent_system_prompt, get_ptp_prompt
 from conversation.dates import resolve_date_phrase, format_date_spoken, local_today
 from conversation.schemas import SessionConfig
+from conversation.state import FALLBACK_CLOSING
 
-client = AsyncAnthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+logger = logging.getLogger(__name__)
+
+# One client per process, on the shared HTTP/2 pool, so keepalive connections
+# are reused across turns and sessions. The SDK default timeout is 10 minutes —
+# far too long for a live voice turn — so bound it tightly.
+get_client = sdk_client(lambda http_client: AsyncAnthropic(
+    api_key=os.getenv("ANTHROPIC_API_KEY"),
+    http_client=http_client,
+    max_retries=2,
+    timeout=httpx.Timeout(10.0, connect=2.0),
+))
+
+# Both calls are short, latency-bound classification/reply tasks, so both run
+# on the small model. Kept separate so either can be moved independently.
+AGENT_MODEL = "claude-haiku-4-5-20251001"
+PTP_MODEL = "claude-haiku-4-5-20251001"
 
 # =====================================================================
 # Robust JSON extraction
@@ -35,15 +53,20 @@ async def extract_ptp(transcript: str, amount_owed: float, config: SessionConfig
     try:
         prompt = get_ptp_prompt(config, amount_owed, transcript)
 
-        message = await client.messages.create(
-            model="claude-haiku-4-5-20251001",
-            max_tokens=300,
+        message = await get_client().messages.create(
+            model=PTP_MODEL,
+            # The PTP object is flat (no nested braces, no "}" in any value),
+            # so generation can stop at its first closing brace.
+            max_tokens=120,
+            stop_sequences=["}"],
             messages=[{"role": "user", "content": prompt}]
         )
 
         response_text = message.content[0].text if message.content else ""
-        print(f"[DEBUG] extract_ptp raw response: stop_reason={message.stop_reason!r}, content={response_text!r}")
-        result = json.loads(_extract_json(response_text))
+        if message.stop_reason == "stop_sequence":
+            response_text += "}"  # the stop sequence itself is not returned
+        logger.debug("extract_ptp raw response: stop_reason=%r, content=%r", message.stop_reason, response_text)
+        result = orjson.loads(_extract_json(response_text))
 
         outcome = result.get("outcome", "no_commitment")
         date_phrase = result.get("date_phrase")
@@ -57,24 +80,23 @@ async def extract_ptp(transcript: str, amount_owed: float, config: SessionConfig
             promise_amount = float(promise_amount)
 
         promise_date_obj = resolve_date_phrase(date_phrase, language=config.language)
-        print(f"[DEBUG] date_phrase={date_phrase!r} resolved to {promise_date_obj}")
+        logger.debug("date_phrase=%r resolved to %s", date_phrase, promise_date_obj)
 
         if outcome == "promise_made":
             if promise_date_obj is None:
                 promise_date_obj = local_today() + timedelta(days=3)
-                print(f"[DEBUG] No usable date_phrase — defaulting to +3 days: {promise_date_obj.isoformat()}")
+                logger.debug("No usable date_phrase — defaulting to +3 days: %s", promise_date_obj)
             if promise_amount is None:
                 promise_amount = amount_owed
-                print(f"[DEBUG] No promise_amount from Claude — defaulting to amount_owed: {promise_amount}")
+                logger.debug("No promise_amount from Claude — defaulting to amount_owed: %s", promise_amount)
 
         promise_date = promise_date_obj.isoformat() if promise_date_obj else None
 
-        print(f"[DEBUG] extract_ptp result: outcome='{outcome}', date={promise_date}, amount={promise_amount}")
+        logger.debug("extract_ptp result: outcome=%r, date=%s, amount=%s", outcome, promise_date, promise_amount)
         return {"outcome": outcome, "promise_date": promise_date, "promise_amount": promise_amount}
 
     except Exception as e:
-        print(f"[ERROR] extract_ptp failed: {e}")
-        traceback.print_exc()
+        logger.exception("extract_ptp failed: %s", e)
         return {"outcome": "no_commitment", "promise_date": None, "promise_amount": None}
 
 
@@ -96,16 +118,18 @@ async def agent_reply(history: list, amount_owed: float, customer_name: str, con
         if not messages:
             messages = [{"role": "user", "content": "[conversation started]"}]
 
-        message = await client.messages.create(
-            model="claude-haiku-4-5-20251001",
-            max_tokens=400,
+        message = await get_client().messages.create(
+            model=AGENT_MODEL,
+            # Replies are capped at two sentences. No "}" stop sequence here:
+            # the reply text itself may contain the {DATE} placeholder.
+            max_tokens=200,
             system=system,
             messages=messages,
         )
 
         raw = message.content[0].text if message.content else ""
-        print(f"[DEBUG] agent_reply raw response: stop_reason={message.stop_reason!r}, content={raw!r}")
-        result = json.loads(_extract_json(raw))
+        logger.debug("agent_reply raw response: stop_reason=%r, content=%r", message.stop_reason, raw)
+        result = orjson.loads(_extract_json(raw))
         reply = result.get("reply", "Could you confirm when you'd be able to make a payment?")
         date_phrase = result.get("date_phrase")
         is_terminal = bool(result.get("is_terminal", False))
@@ -113,21 +137,20 @@ async def agent_reply(history: list, amount_owed: float, customer_name: str, con
         if date_phrase in (None, "null", ""):
             date_phrase = None
 
-        if "{DATE}" in reply:
+        proposed_date = "{DATE}" in reply
+        if proposed_date:
             resolved = resolve_date_phrase(date_phrase, language=config.language)
             if resolved is None:
                 resolved = local_today() + timedelta(days=3)
-                print(f"[DEBUG] agent_reply: date_phrase={date_phrase!r} unresolvable — defaulting to +3 days")
+                logger.debug("agent_reply: date_phrase=%r unresolvable — defaulting to +3 days", date_phrase)
             spoken = format_date_spoken(resolved, language=config.language)
             reply = reply.replace("{DATE}", spoken)
-            print(f"[DEBUG] agent_reply: date_phrase={date_phrase!r} -> {spoken!r}")
+            logger.debug("agent_reply: date_phrase=%r -> %r", date_phrase, spoken)
 
-        print(f"[DEBUG] agent_reply: is_terminal={is_terminal}, reply='{reply}'")
-        return {"reply": reply, "is_terminal": is_terminal}
+        logger.debug("agent_reply: is_terminal=%s, reply=%r", is_terminal, reply)
+        return {"reply": reply, "is_terminal": is_terminal, "proposed_date": proposed_date}
 
     except Exception as e:
-        print(f"[ERROR] agent_reply failed: {e}")
-        traceback.print_exc()
-        if config.language == "Spanish":
-            return {"reply": "Alguien se pondrá en contacto contigo pronto. Adiós.", "is_terminal": True}
-        return {"reply": "Someone will follow up with you shortly. Goodbye.", "is_terminal": True}
\ No newline at end of file
+        logger.exception("agent_reply failed: %s", e)
+        reply = FALLBACK_CLOSING["Spanish" if config.language == "Spanish" else "English"]
+        return {"reply": reply, "is_terminal": True, "proposed_date": False}
\ No newline at end of file
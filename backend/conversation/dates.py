@@ -1,3 +1,4 @@
+import logging
 import parsedatetime
 import re
 from zoneinfo import ZoneInfo
@@ -7,6 +8,8 @@ from datetime import date, timedelta, datetime
 LOCAL_TZ = ZoneInfo("America/Mexico_City")
 _CAL = parsedatetime.Calendar()
 
+logger = logging.getLogger(__name__)
+
 # =====================================================================
 # Spanish date vocabulary (parsedatetime only understands English)
 # =====================================================================
@@ -109,26 +112,26 @@ def resolve_date_phrase(phrase: Optional[str], language: str = "English") -> Opt
 
     if _END_OF_MONTH_EN.search(phrase) or _END_OF_MONTH_ES.search(phrase):
         resolved = _end_of_month_date()
-        print(f"[DEBUG] resolve_date_phrase: matched end-of-month idiom in {phrase!r} -> {resolved}")
+        logger.debug("resolve_date_phrase: matched end-of-month idiom in %r -> %s", phrase, resolved)
         return resolved
 
     working_phrase = phrase
     if language == "Spanish":
         working_phrase = _translate_spanish_date_phrase(phrase)
-        print(f"[DEBUG] resolve_date_phrase: translated {phrase!r} -> {working_phrase!r}")
+        logger.debug("resolve_date_phrase: translated %r -> %r", phrase, working_phrase)
 
     try:
         result, parse_status = _CAL.parseDT(working_phrase, sourceTime=_local_now_naive())
     except Exception as e:
-        print(f"[ERROR] resolve_date_phrase: parsedatetime raised {e!r} for phrase={working_phrase!r}")
+        logger.error("resolve_date_phrase: parsedatetime raised %r for phrase=%r", e, working_phrase)
         return None
 
     if parse_status == 0:
-        print(f"[DEBUG] resolve_date_phrase: phrase={phrase!r}, language={language}, UNPARSEABLE")
+        logger.debug("resolve_date_phrase: phrase=%r, language=%s, UNPARSEABLE", phrase, language)
         return None
 
     resolved = result.date()
-    print(f"[DEBUG] resolve_date_phrase: phrase={phrase!r}, language={language} -> {resolved}")
+    logger.debug("resolve_date_phrase: phrase=%r, language=%s -> %s", phrase, language, resolved)
     return resolved
 
 
@@ -21,21 +21,24 @@ Protocol (JSON messages):
     {"type": "error",    "message": "..."}
 """
 import time
+import asyncio
+import logging
 import base64
-import json
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
-from calls.repository import create_call, update_call_sid, complete_call
+from calls.repository import create_call, complete_call
 from calls.schemas import CallCreate
 from core.exceptions import AppError, NotFoundError, ValidationError
 from customers.repository import get_customer_by_id
 from conversation.agent import extract_ptp, agent_reply
 from conversation.schemas import SessionConfig
-from conversation.state import should_force_close, build_closing_message
+from conversation.state import should_force_close, build_closing_message, is_plain_affirmation, is_canned_line
 from voice.client import synthesize_speech, transcribe_speech
 from voice.formatting import format_amount_for_speech, clean_transcript
 
+logger = logging.getLogger(__name__)
 
 # In-memory session state. Fine for a single-process PoC; in production this
 # becomes a shared store (e.g. Redis) so sessions survive restarts and scale
@@ -51,9 +54,22 @@ _finalized_calls: set = set()
 # I/O helpers
 # ---------------------------------------------------------------------------
 
-async def _send_agent_turn(websocket: WebSocket, text: str, is_terminal: bool, language: str = "English"):
+async def _synthesize_agent_audio(text: str, language: str = "English") -> bytes:
     speech_text = format_amount_for_speech(text, language=language)
-    audio_bytes = await synthesize_speech(speech_text, language=language)
+    return await synthesize_speech(speech_text, language=language, cache=is_canned_line(text))
+
+
+async def _send_agent_turn(
+    websocket: WebSocket,
+    text: str,
+    is_terminal: bool,
+    language: str = "English",
+    audio_bytes: bytes | None = None,
+):
+    """Speak an agent line. Pass `audio_bytes` when the audio was already
+    synthesized concurrently with other work."""
+    if audio_bytes is None:
+        audio_bytes = await _synthesize_agent_audio(text, language=language)
     await websocket.send_json({
         "type": "agent",
         "text": text,  # keep original with "$" for the transcript/UI
@@ -72,14 +88,14 @@ async def _finalize_session(session_id, call_id, amount_owed, started_at, config
         return {"outcome": "no_commitment", "promise_date": None, "promise_amount": None}
 
     history = conversations.get(session_id, [])
-    transcript_json = json.dumps(history)
+    transcript_json = orjson.dumps(history).decode()
     duration_seconds = max(1, int(time.monotonic() - started_at))
 
     if not history:
         ptp = {"outcome": "no_commitment", "promise_date": None, "promise_amount": None}
     else:
         full_transcript_text = " | ".join(f"{t['role']}: {t['text']}" for t in history)
-        print(f"[DEBUG] Finalizing session {session_id} — extracting PTP (language={config.language})")
+        logger.debug("Finalizing session %s — extracting PTP (language=%s)", session_id, config.language)
         ptp = await extract_ptp(full_transcript_text, amount_owed, config)
 
     if call_id is not None:
@@ -92,16 +108,27 @@ async def _finalize_session(session_id, call_id, amount_owed, started_at, config
             promise_amount=ptp["promise_amount"],
         )
         _finalized_calls.add(call_id)
-        print(f"[DEBUG] Completed call {call_id}: outcome='{ptp['outcome']}'")
+        logger.debug("Completed call %s: outcome=%r", call_id, ptp["outcome"])
     else:
-        print(f"[ERROR] Cannot persist outcome — call_id is None for session={session_id}")
+        logger.error("Cannot persist outcome — call_id is None for session=%s", session_id)
 
     return ptp
 
 
+def _discard_task(task: asyncio.Task) -> None:
+    """Drop a speculative task we no longer need. cancel() is a no-op once the
+    task has finished, so also retrieve any exception it already raised —
+    otherwise asyncio logs "Task exception was never retrieved"."""
+    task.cancel()
+    if task.done() and not task.cancelled():
+        task.exception()
+
+
 def _log_turn(role: str, text: str, language: str = "English"):
+    # DEBUG, like the other per-turn detail: the text is the customer's own
+    # speech, which has no place in production logs.
     prefix = "[AGENT SPEAKS]" if role == "agent" else "[CUSTOMER RESPONDS]"
-    print(f"{prefix} [LANG={language}] {text[:80]}...")
+    logger.debug("%s [LANG=%s] %s...", prefix, language, text[:80])
 
 
 async def _send_error(websocket: WebSocket, message: str):
@@ -143,7 +170,7 @@ def _build_opening(config: SessionConfig, customer_name: str, amount_owed: float
 async def run_voice_session(websocket: WebSocket):
     """Drive one full browser voice session over the WebSocket."""
     await websocket.accept()
-    print("\n[DEBUG] ========== WEBSOCKET SESSION OPENED ==========")
+    logger.debug("========== WEBSOCKET SESSION OPENED ==========")
 
     session_id = None
     call_id = None
@@ -151,6 +178,8 @@ async def run_voice_session(websocket: WebSocket):
     started_at = time.monotonic()
     finalized = False
     session_config = None
+    # Whether the last agent line proposed a resolved {DATE} for confirmation.
+    awaiting_date_confirmation = False
 
     try:
         # Wait for the client's "start" message.
@@ -170,8 +199,8 @@ async def run_voice_session(websocket: WebSocket):
             session_config.validate()
         except ValueError as e:
             raise ValidationError(f"Invalid config: {e}")
-        print(f"[DEBUG] Session config: language={session_config.language}, "
-              f"company={session_config.company_name}, debt_type={session_config.debt_type}")
+        logger.debug("Session config: language=%s, company=%s, debt_type=%s",
+                     session_config.language, session_config.company_name, session_config.debt_type)
 
         # Identity and debt amount come from the customer record — the source of truth.
         customer_id = first.get("customer_id")
@@ -188,21 +217,37 @@ async def run_voice_session(websocket: WebSocket):
 
         started_at = time.monotonic()
 
-        # Create the call row, linked to the customer and snapshotting their name.
-        call_id = await create_call(CallCreate(
-            phone_number=debtor_phone,
-            amount_owed=amount_owed,
-            customer_id=customer["id"],
-            customer_name=customer_name,
-        ))
-        await update_call_sid(call_id, session_id)
-        print(f"[DEBUG] Created call id={call_id}, customer_id={customer['id']}, amount_owed={amount_owed}")
+        # The opening line only needs the customer record, so synthesize its
+        # audio while the call row is being written instead of after. Both
+        # legs always run to completion (return_exceptions), so if TTS fails
+        # the row still exists and call_id is set before we re-raise — the
+        # finally-block fallback then finalizes it instead of leaving it
+        # stuck in 'initiated'.
+        opening = _build_opening(session_config, customer_name, amount_owed)
+        created, opening_audio = await asyncio.gather(
+            create_call(CallCreate(
+                phone_number=debtor_phone,
+                amount_owed=amount_owed,
+                customer_id=customer["id"],
+                customer_name=customer_name,
+                call_sid=session_id,
+            )),
+            _synthesize_agent_audio(opening, language=session_config.language),
+            return_exceptions=True,
+        )
+        if isinstance(created, BaseException):
+            raise created
+        call_id = created
+        if isinstance(opening_audio, BaseException):
+            raise opening_audio
+        logger.debug("Created call id=%s, customer_id=%s, amount_owed=%s", call_id, customer["id"], amount_owed)
 
         # Seed the conversation with the agent's opening line and speak it.
-        opening = _build_opening(session_config, customer_name, amount_owed)
         conversations[session_id] = [{"role": "agent", "text": opening}]
         _log_turn("agent", opening, session_config.language)
-        await _send_agent_turn(websocket, opening, False, language=session_config.language)
+        await _send_agent_turn(
+            websocket, opening, False, language=session_config.language, audio_bytes=opening_audio
+        )
 
         # Turn loop.
         while True:
@@ -210,7 +255,7 @@ async def run_voice_session(websocket: WebSocket):
             msg_type = msg.get("type")
 
             if msg_type == "end":
-                print(f"[DEBUG] Client ended session {session_id}")
+                logger.debug("Client ended session %s", session_id)
                 break
 
             if msg_type != "user_audio":
@@ -251,13 +296,19 @@ async def run_voice_session(websocket: WebSocket):
             # Max-turns guard. At the limit we skip the model call — the real
             # outcome isn't known until extraction runs, so we don't let the
             # model improvise a closing line.
-            if should_force_close(history):
+            # A plain "yes" to a date the agent just proposed is a commitment
+            # with nothing left to negotiate, so it takes the same path: no
+            # model call, closing built from the extracted PTP.
+            if should_force_close(history) or (
+                awaiting_date_confirmation and is_plain_affirmation(speech, session_config.language)
+            ):
                 reply_text = None
                 is_terminal = True
             else:
                 ar = await agent_reply(history, amount_owed, customer_name, session_config)
                 reply_text = ar["reply"]
                 is_terminal = ar["is_terminal"]
+                awaiting_date_confirmation = ar.get("proposed_date", False)
                 history.append({"role": "agent", "text": reply_text})
                 conversations[session_id] = history
 
@@ -266,7 +317,20 @@ async def run_voice_session(websocket: WebSocket):
                     continue
 
             # Terminal turn — extract PTP, build the closing line, persist.
-            ptp = await _finalize_session(session_id, call_id, amount_owed, started_at, session_config)
+            # The closing is the model's own reply for every outcome except a
+            # refusal, so speculatively synthesize it while extraction runs and
+            # discard the audio if the closing turns out different.
+            speculative_audio = None
+            if reply_text is not None:
+                speculative_audio = asyncio.create_task(
+                    _synthesize_agent_audio(reply_text, language=session_config.language)
+                )
+            try:
+                ptp = await _finalize_session(session_id, call_id, amount_owed, started_at, session_config)
+            except BaseException:
+                if speculative_audio is not None:
+                    _discard_task(speculative_audio)
+                raise
             finalized = True
 
             closing = build_closing_message(
@@ -275,7 +339,15 @@ async def run_voice_session(websocket: WebSocket):
             history.append({"role": "agent", "text": closing})
             conversations[session_id] = history
 
-            await _send_agent_turn(websocket, closing, True, language=session_config.language)
+            closing_audio = None
+            if speculative_audio is not None:
+                if closing == reply_text:
+                    closing_audio = await speculative_audio
+                else:
+                    _discard_task(speculative_audio)
+            await _send_agent_turn(
+                websocket, closing, True, language=session_config.language, audio_bytes=closing_audio
+            )
             await websocket.send_json({
                 "type": "complete",
                 "outcome": ptp["outcome"],
@@ -285,13 +357,13 @@ async def run_voice_session(websocket: WebSocket):
             break
 
     except WebSocketDisconnect:
-        print(f"[DEBUG] WebSocket disconnected (session={session_id})")
+        logger.debug("WebSocket disconnected (session=%s)", session_id)
     except AppError as e:
         # Expected, client-facing errors (bad start, missing/unknown customer).
-        print(f"[DEBUG] voice_session rejected: {e.error_type}: {e.message}")
+        logger.debug("voice_session rejected: %s: %s", e.error_type, e.message)
         await _send_error(websocket, e.message)
     except Exception as e:
-        print(f"[ERROR] voice_session failed: {e}")
+        logger.exception("voice_session failed: %s", e)
         await _send_error(websocket, "session error")
     finally:
         # Best-effort persistence if the session ended without a clean terminal turn.
@@ -299,7 +371,7 @@ async def run_voice_session(websocket: WebSocket):
             try:
                 await _finalize_session(session_id, call_id, amount_owed, started_at, session_config)
             except Exception as e:
-                print(f"[ERROR] finalize-on-disconnect failed: {e}")
+                logger.exception("finalize-on-disconnect failed: %s", e)
         if session_id is not None:
             conversations.pop(session_id, None)
         if call_id is not None:
@@ -308,4 +380,4 @@ async def run_voice_session(websocket: WebSocket):
             await websocket.close()
         except Exception:
             pass
-        print(f"[DEBUG] ========== WEBSOCKET SESSION CLOSED (session={session_id}) ==========")
\ No newline at end of file
+        logger.debug("========== WEBSOCKET SESSION CLOSED (session=%s) ==========", session_id)
\ No newline at end of file
@@ -6,6 +6,7 @@ No I/O lives here — no sockets, no LLM calls, no DB. That is the whole point:
 these are decisions the turn loop makes, pulled out so they can be unit-tested
 by calling a function and asserting on the result, with zero mocks.
 """
+import re
 from datetime import date
 
 from conversation.dates import format_date_spoken
@@ -14,6 +15,29 @@ from conversation.schemas import SessionConfig
 # Max customer turns before we force the conversation to a close.
 MAX_CUSTOMER_TURNS = 6
 
+# Fixed closing lines, per language. These are the only agent lines that repeat
+# verbatim across sessions (everything else carries the customer's name,
+# amount or date), so they are the only ones worth caching as audio.
+REFUSED_CLOSING = {
+    "English": "I understand. A specialist will follow up with you. Goodbye.",
+    "Spanish": "Entiendo. Un especialista se pondrá en contacto contigo. Adiós.",
+}
+NO_COMMITMENT_CLOSING = {
+    "English": "We weren't able to confirm a date. Someone will reach out to you soon. Goodbye.",
+    "Spanish": "No pudimos confirmar una fecha. Alguien se pondrá en contacto contigo pronto. Adiós.",
+}
+# Spoken when the model call itself fails.
+FALLBACK_CLOSING = {
+    "English": "Someone will follow up with you shortly. Goodbye.",
+    "Spanish": "Alguien se pondrá en contacto contigo pronto. Adiós.",
+}
+
+_CANNED_LINES = frozenset(
+    line
+    for closings in (REFUSED_CLOSING, NO_COMMITMENT_CLOSING, FALLBACK_CLOSING)
+    for line in closings.values()
+)
+
 
 def count_customer_turns(history: list[dict]) -> int:
     """How many turns the customer has taken so far."""
@@ -25,6 +49,54 @@ def should_force_close(history: list[dict], max_turns: int = MAX_CUSTOMER_TURNS)
     return count_customer_turns(history) >= max_turns
 
 
+# Short, unconditional agreements. Only ever checked against a reply to a date
+# the agent just proposed, and the WHOLE utterance must consist of these
+# phrases — "yes, but Monday" or "yeah no" fall through to the model.
+# Courtesies may follow an agreement but never count as one on their own.
+_AFFIRMATIONS = {
+    "English": (
+        "yes", "yeah", "yep", "yup", "sure", "ok", "okay", "correct", "agreed",
+        "i agree", "absolutely", "of course", "perfect", "great", "sounds good",
+        "that works", "that works for me", "that's fine", "fine", "deal",
+    ),
+    "Spanish": (
+        "sí", "si", "claro", "ok", "okay", "vale", "correcto", "de acuerdo",
+        "está bien", "esta bien", "perfecto", "me parece bien", "por supuesto",
+        "sale", "así es", "asi es",
+    ),
+}
+_COURTESIES = {
+    "English": ("thanks", "thank you"),
+    "Spanish": ("gracias", "muchas gracias"),
+}
+
+
+def _alternation(phrases) -> str:
+    # Longest first, so "that works for me" wins over "that works".
+    return "|".join(re.escape(p) for p in sorted(phrases, key=len, reverse=True))
+
+
+_AFFIRMATION_RE = {
+    language: re.compile(r"(?:{0})(?: (?:{0}|{1}))*".format(
+        _alternation(phrases), _alternation(_COURTESIES[language])
+    ))
+    for language, phrases in _AFFIRMATIONS.items()
+}
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s']+")
+
+
+def is_plain_affirmation(text: str, language: str = "English") -> bool:
+    """True when the utterance is nothing but agreement ("Yes.", "Sí, claro",
+    "Okay, that works"). Anything else — a condition, a new date, a
+    hedge — is ambiguous and must go to the model."""
+    normalized = " ".join(_PUNCTUATION_RE.sub(" ", text.lower()).split())
+    if not normalized:
+        return False
+    pattern = _AFFIRMATION_RE.get(language, _AFFIRMATION_RE["English"])
+    return pattern.fullmatch(normalized) is not None
+
+
 def build_closing_message(
     outcome: str,
     ptp: dict,
@@ -59,18 +131,15 @@ def build_closing_message(
             f"${ptp['promise_amount']:.2f} payment. Thank you for your time."
         )
 
+    language = "Spanish" if es else "English"
     if outcome == "refused":
-        return (
-            "Entiendo. Un especialista se pondrá en contacto contigo. Adiós."
-            if es
-            else "I understand. A specialist will follow up with you. Goodbye."
-        )
+        return REFUSED_CLOSING[language]
 
     # no_commitment / anything else
-    if es:
-        return model_reply or (
-            "No pudimos confirmar una fecha. Alguien se pondrá en contacto contigo pronto. Adiós."
-        )
-    return model_reply or (
-        "We weren't able to confirm a date. Someone will reach out to you soon. Goodbye."
-    )
\ No newline at end of file
+    return model_reply or NO_COMMITMENT_CLOSING[language]
+
+
+def is_canned_line(text: str) -> bool:
+    """True for the fixed closing lines, which are identical across sessions
+    and carry no customer details."""
+    return text in _CANNED_LINES
\ No newline at end of file
@@ -1,20 +1,22 @@
 import asyncpg
 import os
 import sys
-from pathlib import Path
 from typing import Optional
-from dotenv import load_dotenv
 
 # Fix for Windows asyncpg compatibility
 if sys.platform == 'win32':
     import asyncio
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
-env_path = Path(__file__).resolve().parent.parent.parent / ".env"
-load_dotenv(dotenv_path=env_path)
-
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# Pool bounds are per worker. The defaults stay small because the Supabase
+# session pooler caps clients per project (~15 on the smallest compute), and
+# every worker holds min_size connections from boot. Raise these only when the
+# database side can take workers x max_size connections.
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+
 _pool: Optional[asyncpg.Pool] = None
 
 async def get_pool() -> asyncpg.Pool:
@@ -25,9 +27,11 @@ async def get_pool() -> asyncpg.Pool:
             raise ValueError("DATABASE_URL environment variable is not set")
         _pool = await asyncpg.create_pool(
             DATABASE_URL,
-            min_size=2,
-            max_size=10,
-            command_timeout=60
+            # min_size connections are opened up front (see the app lifespan)
+            # so the first sessions don't pay connection setup inline.
+            min_size=DB_POOL_MIN_SIZE,
+            max_size=DB_POOL_MAX_SIZE,
+            command_timeout=60,
         )
     return _pool
 
@@ -9,10 +9,14 @@ Two surfaces, one vocabulary:
   itself and emits its {"type": "error"} protocol frame. Same exceptions,
   different transport.
 """
+import logging
+
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 
+logger = logging.getLogger(__name__)
+
 
 class AppError(Exception):
     """Base for expected, domain-level errors. Carries an HTTP status and a
@@ -46,14 +50,14 @@ def register_exception_handlers(app: FastAPI) -> None:
 
     @app.exception_handler(AppError)
     async def _handle_app_error(request: Request, exc: AppError):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content=error_body(exc.error_type, exc.message),
         )
 
     @app.exception_handler(RequestValidationError)
     async def _handle_request_validation(request: Request, exc: RequestValidationError):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=422,
             content=error_body("validation_error", "Invalid request payload"),
         )
@@ -61,8 +65,8 @@ def register_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(Exception)
     async def _handle_unexpected(request: Request, exc: Exception):
         # Anything unplanned: log the detail server-side, return a generic body.
-        print(f"[ERROR] Unhandled exception on {request.url.path}: {exc!r}")
-        return JSONResponse(
+        logger.error("Unhandled exception on %s: %r", request.url.path, exc, exc_info=exc)
+        return ORJSONResponse(
             status_code=500,
             content=error_body("internal_error", "An unexpected error occurred"),
         )
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""
+One shared HTTP connection pool for every outbound API client.
+
+The Anthropic and ElevenLabs SDKs each build a private httpx client by
+default. Handing both this one instead means a single keepalive pool for the
+process, with HTTP/2 so concurrent sessions multiplex requests over one
+connection per host instead of each paying its own TCP + TLS handshake.
+
+The pool's own timeout is only a fallback. Each SDK client is built with an
+explicit timeout of its own, so its per-request limit is visible where the
+client is created instead of depending on SDK defaults.
+
+The pool is opened in the app lifespan and closed on shutdown. SDK clients
+are built through sdk_client(), which rebuilds them whenever the pool has been
+reopened, so a second lifespan cycle in the same process never hands an SDK a
+closed client.
+"""
+from typing import Callable, Optional, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, opening a new one if none is open yet or the
+    last one was closed by a previous shutdown."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared pool (called from the app lifespan on shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def sdk_client(factory: Callable[[httpx.AsyncClient], T]) -> Callable[[], T]:
+    """Turn an SDK client factory into a getter that returns one shared
+    instance, rebuilt only when the underlying pool has been replaced."""
+    built: dict = {}
+
+    def get() -> T:
+        http_client = get_http_client()
+        if built.get("http_client") is not http_client:
+            built["client"] = factory(http_client)
+            built["http_client"] = http_client
+        return built["client"]
+
+    return get
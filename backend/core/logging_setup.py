@@ -0,0 +1,51 @@
+"""
+Process-wide logging configuration.
+
+setup_logging() runs once at import and installs a plain stream handler, so
+records logged outside the app's lifetime (startup imports, shutdown, tests)
+are always written. While the app is serving, queued_logging() swaps that for
+a QueueHandler: request handlers only enqueue, and a QueueListener thread does
+the actual (blocking) stream write. On exit the direct handler is restored,
+so each lifespan cycle starts and stops its own listener.
+
+Level comes from LOG_LEVEL (default INFO), so the per-turn DEBUG detail costs
+nothing in production — modules log with lazy %-style arguments that are
+never formatted when the level is disabled.
+"""
+import logging
+import os
+import queue
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+
+def setup_logging() -> None:
+    """Install a direct stream handler on the root logger."""
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    root = logging.getLogger()
+    root.handlers = [stream_handler]
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+
+
+@contextmanager
+def queued_logging():
+    """Route root-logger records through a queue for the duration of the
+    block, writing them from a background thread via the handlers that were
+    installed on entry. Those handlers are put back on exit, after the
+    listener has flushed everything still queued."""
+    root = logging.getLogger()
+    direct_handlers = root.handlers[:]
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    listener = QueueListener(log_queue, *direct_handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    try:
+        yield
+    finally:
+        listener.stop()
+        root.handlers = direct_handlers
@@ -1,29 +1,48 @@
+import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+from dotenv import load_dotenv
+
+# Load .env exactly once, before importing any app module: several of them
+# read os.environ at import time (DATABASE_URL, API keys) and none load it
+# themselves.
+env_path = Path(__file__).resolve().parent.parent / '.env'
+load_dotenv(dotenv_path=env_path, override=False)
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from dotenv import load_dotenv
+from fastapi.responses import ORJSONResponse
 
-from core.database import close_pool
+from core.database import get_pool, close_pool
 from core.exceptions import register_exception_handlers
+from core.http_client import get_http_client, close_http_client
+from core.logging_setup import setup_logging, queued_logging
 from customers.router import router as customers_router
 from calls.router import router as calls_router
 from conversation.router import router as conversation_router
 
-env_path = Path(__file__).resolve().parent.parent / '.env'
-load_dotenv(dotenv_path=env_path)
+setup_logging()
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    yield
-    await close_pool()
-    print("Database connection pool closed")
+    with queued_logging():
+        # Open the pools at boot so connections are ready before the first
+        # session, instead of being created inline with a live call. The HTTP
+        # pool is (re)opened here because a previous shutdown closes it.
+        await get_pool()
+        logger.info("Database connection pool ready")
+        get_http_client()
+        yield
+        await close_pool()
+        logger.info("Database connection pool closed")
+        await close_http_client()
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="Voice IVR PoC", lifespan=lifespan)
+    app = FastAPI(title="Voice IVR PoC", default_response_class=ORJSONResponse, lifespan=lifespan)
 
     app.add_middleware(
         CORSMiddleware,
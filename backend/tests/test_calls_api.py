@@ -0,0 +1,47 @@
+"""
+Tests for the /api/calls pagination parameters.
+
+The repository is patched at calls.router.get_all_calls (where the router
+looks it up), so no database is needed — we only check how query params are
+validated and forwarded.
+"""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+@pytest.fixture
+def get_all_calls():
+    mock = AsyncMock(return_value=[])
+    with patch("calls.router.get_all_calls", mock):
+        yield mock
+
+
+def test_no_params_returns_full_history(get_all_calls):
+    # The dashboard computes its stats from this response, so paging must
+    # stay opt-in.
+    r = TestClient(app).get("/api/calls")
+    assert r.status_code == 200
+    get_all_calls.assert_awaited_once_with(limit=None, before_id=None)
+
+
+def test_forwards_limit_and_cursor(get_all_calls):
+    r = TestClient(app).get("/api/calls", params={"limit": 25, "cursor": 812})
+    assert r.status_code == 200
+    get_all_calls.assert_awaited_once_with(limit=25, before_id=812)
+
+
+@pytest.mark.parametrize("limit", [0, 501])
+def test_rejects_out_of_range_limit(get_all_calls, limit):
+    r = TestClient(app).get("/api/calls", params={"limit": limit})
+    assert r.status_code == 422
+    get_all_calls.assert_not_awaited()
+
+
+def test_unknown_cursor_is_rejected(get_all_calls):
+    get_all_calls.return_value = None
+    r = TestClient(app).get("/api/calls", params={"limit": 25, "cursor": 999})
+    assert r.status_code == 400
@@ -0,0 +1,55 @@
+"""
+Unit tests for get_all_calls keyset paging (calls.repository).
+
+get_pool is patched at calls.repository.get_pool with a fake pool whose
+connection records its calls, so no database is needed — we check how the
+cursor is resolved and what the page query is given, not Postgres itself.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from calls import repository
+
+CURSOR_AT = datetime(2026, 10, 15, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def conn():
+    conn = SimpleNamespace(
+        fetchval=AsyncMock(return_value=CURSOR_AT),
+        fetch=AsyncMock(return_value=[{"id": 811}]),
+    )
+
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    pool = SimpleNamespace(acquire=acquire)
+    with patch("calls.repository.get_pool", AsyncMock(return_value=pool)):
+        yield conn
+
+
+def test_full_history_skips_cursor_lookup(conn):
+    assert asyncio.run(repository.get_all_calls()) == [{"id": 811}]
+    conn.fetchval.assert_not_awaited()
+    assert conn.fetch.await_args.args[1:] == (None, None, None)
+
+
+def test_page_is_keyed_on_the_cursor_row(conn):
+    asyncio.run(repository.get_all_calls(limit=25, before_id=812))
+    assert conn.fetchval.await_args.args[1:] == (812,)
+    query, *params = conn.fetch.await_args.args
+    assert params == [25, 812, CURSOR_AT]
+    assert "(initiated_at, id) < ($3::timestamptz, $2::int)" in query
+    assert "ORDER BY initiated_at DESC, id DESC" in query
+
+
+def test_unknown_cursor_returns_none(conn):
+    conn.fetchval.return_value = None
+    assert asyncio.run(repository.get_all_calls(limit=25, before_id=999)) is None
+    conn.fetch.assert_not_awaited()
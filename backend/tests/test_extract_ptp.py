@@ -0,0 +1,45 @@
+"""
+Unit tests for extract_ptp's response handling (conversation.agent).
+
+The Anthropic client is patched on conversation.agent.get_client(), so these only
+exercise how the raw model text is turned into a PTP dict — in particular
+that output cut at the "}" stop sequence still parses.
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from conversation import agent
+from conversation.schemas import SessionConfig
+
+
+def _message(text: str, stop_reason: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=text)],
+        stop_reason=stop_reason,
+        usage=SimpleNamespace(input_tokens=0, output_tokens=0),
+    )
+
+
+def _run(message: SimpleNamespace) -> dict:
+    create = AsyncMock(return_value=message)
+    with patch.object(agent.get_client().messages, "create", create):
+        return asyncio.run(agent.extract_ptp("customer: sure", 250.0, SessionConfig()))
+
+
+def test_restores_brace_dropped_by_stop_sequence():
+    msg = _message('{"outcome": "refused", "date_phrase": null, "promise_amount": null', "stop_sequence")
+    assert _run(msg) == {"outcome": "refused", "promise_date": None, "promise_amount": None}
+
+
+def test_complete_json_on_end_turn_is_untouched():
+    msg = _message('{"outcome": "refused", "date_phrase": null, "promise_amount": null}', "end_turn")
+    assert _run(msg)["outcome"] == "refused"
+
+
+def test_promise_without_amount_defaults_to_amount_owed():
+    msg = _message('{"outcome": "promise_made", "date_phrase": null, "promise_amount": null', "stop_sequence")
+    result = _run(msg)
+    assert result["outcome"] == "promise_made"
+    assert result["promise_amount"] == 250.0
+    assert result["promise_date"] is not None   # falls back to +3 days
@@ -0,0 +1,34 @@
+"""
+Unit tests for the shared HTTP pool's lifecycle (core.http_client).
+
+A shutdown closes the pool; the next lifespan must get a fresh one, and SDK
+clients built through sdk_client() must follow it rather than keep the
+closed client.
+"""
+import asyncio
+
+from core import http_client
+
+
+def test_pool_is_reopened_after_close():
+    first = http_client.get_http_client()
+    asyncio.run(http_client.close_http_client())
+    assert first.is_closed
+
+    second = http_client.get_http_client()
+    assert second is not first
+    assert not second.is_closed
+
+
+def test_sdk_client_is_rebuilt_only_when_pool_changes():
+    get = http_client.sdk_client(lambda pool: {"pool": pool})
+
+    built = get()
+    assert get() is built
+    assert built["pool"] is http_client.get_http_client()
+
+    asyncio.run(http_client.close_http_client())
+    rebuilt = get()
+    assert rebuilt is not built
+    assert rebuilt["pool"] is http_client.get_http_client()
+    assert not rebuilt["pool"].is_closed
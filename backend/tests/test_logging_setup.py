@@ -0,0 +1,45 @@
+"""
+Unit tests for core.logging_setup.
+
+Each test captures the root logger's handlers and restores them afterwards,
+so nothing here leaks into the rest of the suite.
+"""
+import io
+import logging
+
+import pytest
+
+from core.logging_setup import queued_logging
+
+
+@pytest.fixture
+def stream():
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    buf = io.StringIO()
+    root.handlers = [logging.StreamHandler(buf)]
+    root.setLevel(logging.INFO)
+    yield buf
+    root.handlers, root.level = saved_handlers, saved_level
+
+
+def test_records_logged_while_queued_are_flushed(stream):
+    with queued_logging():
+        logging.getLogger("t").info("during")
+    assert "during" in stream.getvalue()
+
+
+def test_direct_handler_is_restored_after_exit(stream):
+    with queued_logging():
+        pass
+    logging.getLogger("t").info("after")
+    assert "after" in stream.getvalue()
+
+
+def test_can_run_repeatedly(stream):
+    # One cycle per app lifespan — a second cycle in the same process must work.
+    for n in range(2):
+        with queued_logging():
+            logging.getLogger("t").info("cycle %d", n)
+    assert "cycle 0" in stream.getvalue()
+    assert "cycle 1" in stream.getvalue()
@@ -0,0 +1,71 @@
+"""
+Unit tests for the synthesize_speech LRU cache (voice.client).
+
+The ElevenLabs client is patched on voice.client.get_client(), so no API key or
+network is needed — we only count how often the upstream call happens.
+"""
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from voice import client as voice_client
+
+
+def _fake_stream(*chunks: bytes):
+    async def _gen():
+        for chunk in chunks:
+            yield chunk
+    return _gen()
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    voice_client._speech_cache.clear()
+    yield
+    voice_client._speech_cache.clear()
+
+
+@pytest.fixture
+def convert():
+    mock = MagicMock(side_effect=lambda **_: _fake_stream(b"mp3-", b"bytes"))
+    with patch.object(voice_client.get_client().text_to_speech, "convert", mock):
+        yield mock
+
+
+def test_repeated_line_is_synthesized_once(convert):
+    first = asyncio.run(voice_client.synthesize_speech("Goodbye.", cache=True))
+    second = asyncio.run(voice_client.synthesize_speech("Goodbye.", cache=True))
+    assert first == second == b"mp3-bytes"
+    assert convert.call_count == 1
+
+
+def test_uncached_line_is_synthesized_every_time(convert):
+    asyncio.run(voice_client.synthesize_speech("Hi Alice, you owe $250.00."))
+    asyncio.run(voice_client.synthesize_speech("Hi Alice, you owe $250.00."))
+    assert convert.call_count == 2
+    assert not voice_client._speech_cache
+
+
+def test_cache_is_keyed_per_voice(convert):
+    voices = {"English": "voice-en", "Spanish": "voice-es"}
+    with patch.dict(voice_client.VOICE_MAPPING, voices):
+        asyncio.run(voice_client.synthesize_speech("Adiós.", language="English", cache=True))
+        asyncio.run(voice_client.synthesize_speech("Adiós.", language="Spanish", cache=True))
+    assert convert.call_count == 2
+
+
+def test_empty_audio_is_not_cached():
+    convert = MagicMock(side_effect=lambda **_: _fake_stream())
+    with patch.object(voice_client.get_client().text_to_speech, "convert", convert):
+        asyncio.run(voice_client.synthesize_speech("Hello.", cache=True))
+        asyncio.run(voice_client.synthesize_speech("Hello.", cache=True))
+    assert convert.call_count == 2
+
+
+def test_cache_evicts_least_recently_used(convert):
+    with patch.object(voice_client, "SPEECH_CACHE_MAX_ENTRIES", 2):
+        for text in ("one", "two", "three"):
+            asyncio.run(voice_client.synthesize_speech(text, cache=True))
+        asyncio.run(voice_client.synthesize_speech("one", cache=True))
+    assert convert.call_count == 4
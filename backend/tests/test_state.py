@@ -6,11 +6,16 @@ function and assert on the string/number it returns. If any of these ever
 NEEDS a mock, something impure leaked into state.py and should move back to
 the service.
 """
+import pytest
+
 from conversation.schemas import SessionConfig
 from conversation.state import (
     count_customer_turns,
     should_force_close,
     build_closing_message,
+    is_plain_affirmation,
+    is_canned_line,
+    FALLBACK_CLOSING,
     MAX_CUSTOMER_TURNS,
 )
 
@@ -43,6 +48,31 @@ def test_should_force_close_at_limit():
     assert should_force_close(history) is True
 
 
+# --- is_plain_affirmation ------------------------------------------------
+
+@pytest.mark.parametrize("text", ["Yes.", "yeah", "Okay, that works for me!", "Sure, thank you"])
+def test_plain_affirmation_english(text):
+    assert is_plain_affirmation(text, "English") is True
+
+
+@pytest.mark.parametrize("text", ["Sí", "Sí, claro.", "Está bien, gracias"])
+def test_plain_affirmation_spanish(text):
+    assert is_plain_affirmation(text, "Spanish") is True
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "no",
+    "yeah no",
+    "yes but make it Monday",
+    "I guess",
+    "thanks",             # courtesy alone isn't agreement
+    "sure, next week",    # a new timeframe needs the model
+])
+def test_not_plain_affirmation(text):
+    assert is_plain_affirmation(text, "English") is False
+
+
 # --- build_closing_message: promise_made, forced-close (no model reply) --
 # This is the acceptance criterion "forced-turn-limit closing logic".
 
@@ -108,4 +138,21 @@ def test_closing_no_commitment_spanish():
 def test_closing_no_commitment_prefers_model_reply():
     config = SessionConfig(language="English")
     msg = build_closing_message("no_commitment", {}, "See you soon.", config, "Alice")
-    assert msg == "See you soon."
\ No newline at end of file
+    assert msg == "See you soon."
+
+
+# --- is_canned_line -------------------------------------------------------
+
+@pytest.mark.parametrize("language", ["English", "Spanish"])
+def test_canned_closings_are_canned(language):
+    config = SessionConfig(language=language)
+    for outcome in ("refused", "no_commitment"):
+        assert is_canned_line(build_closing_message(outcome, {}, None, config, "Alice"))
+    assert is_canned_line(FALLBACK_CLOSING[language])
+
+
+def test_personalized_closing_is_not_canned():
+    config = SessionConfig(language="English")
+    ptp = {"promise_date": "2026-10-20", "promise_amount": 250.0}
+    assert not is_canned_line(build_closing_message("promise_made", ptp, None, config, "Alice"))
+    assert not is_canned_line("See you soon.")
@@ -14,7 +14,9 @@ its namespace — patching voice.client.synthesize_speech would not affect it.
 Requires httpx (Starlette's TestClient uses it). If TestClient import fails:
     pip install httpx
 """
+import asyncio
 import base64
+import gc
 from contextlib import ExitStack
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
@@ -23,6 +25,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from main import app
+from conversation.service import _discard_task
 from conversation.state import MAX_CUSTOMER_TURNS
 
 
@@ -40,7 +43,6 @@ def mocks():
             "id": 1, "name": "Alice", "phone": "+521234567890", "amount_owed": 1000.0,
         }),
         "create_call": AsyncMock(return_value=42),
-        "update_call_sid": AsyncMock(),
         "complete_call": AsyncMock(),
         "agent_reply": AsyncMock(),
         "extract_ptp": AsyncMock(),
@@ -64,7 +66,9 @@ def test_ws_reaches_promise(mocks):
 
     client = TestClient(app)
     with client.websocket_connect("/ws/session") as ws:
-        ws.send_json({"type": "start", "customer_id": 1, "language": "English"})
+        ws.send_json({
+            "type": "start", "session_id": "sess-1", "customer_id": 1, "language": "English",
+        })
 
         opening = ws.receive_json()
         assert opening["type"] == "agent"
@@ -84,6 +88,121 @@ def test_ws_reaches_promise(mocks):
         assert done["promise_date"] == "2026-07-17"
 
     mocks.complete_call.assert_awaited_once()
+    # The session ID is written with the call row, not in a follow-up UPDATE.
+    assert mocks.create_call.await_args.args[0].call_sid == "sess-1"
+
+
+def test_ws_refusal_replaces_speculative_closing(mocks):
+    """The model's terminal reply is synthesized speculatively during PTP
+    extraction; on a refusal the canned closing must be spoken instead."""
+    mocks.transcribe_speech.return_value = "No, I'm not paying that"
+    mocks.agent_reply.return_value = {"reply": "Great, see you Friday.", "is_terminal": True}
+    mocks.extract_ptp.return_value = {
+        "outcome": "refused", "promise_date": None, "promise_amount": None,
+    }
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/session") as ws:
+        ws.send_json({"type": "start", "customer_id": 1, "language": "English"})
+        assert ws.receive_json()["type"] == "agent"  # opening
+
+        ws.send_json({"type": "user_audio", "audio": _audio()})
+        assert ws.receive_json()["type"] == "user"
+
+        agent = ws.receive_json()
+        assert agent["is_terminal"] is True
+        assert agent["text"] == "I understand. A specialist will follow up with you. Goodbye."
+
+        assert ws.receive_json()["outcome"] == "refused"
+
+    spoken = [c.args[0] for c in mocks.synthesize_speech.await_args_list]
+    assert spoken[-1] == "I understand. A specialist will follow up with you. Goodbye."
+
+
+def test_ws_plain_yes_to_proposed_date_skips_model(mocks):
+    """Once the agent has proposed a resolved date, a bare "yes" closes the
+    session without another model call; the closing is built from the PTP."""
+    mocks.transcribe_speech.side_effect = ["next Friday", "Yes, that works."]
+    mocks.agent_reply.return_value = {
+        "reply": "So that would be Friday, July 17 — does that work?",
+        "is_terminal": False,
+        "proposed_date": True,
+    }
+    mocks.extract_ptp.return_value = {
+        "outcome": "promise_made", "promise_date": "2026-07-17", "promise_amount": 1000.0,
+    }
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/session") as ws:
+        ws.send_json({"type": "start", "customer_id": 1, "language": "English"})
+        assert ws.receive_json()["type"] == "agent"  # opening
+
+        ws.send_json({"type": "user_audio", "audio": _audio()})
+        assert ws.receive_json()["type"] == "user"
+        assert ws.receive_json()["is_terminal"] is False
+
+        ws.send_json({"type": "user_audio", "audio": _audio()})
+        assert ws.receive_json() == {"type": "user", "text": "Yes, that works."}
+        agent = ws.receive_json()
+        assert agent["is_terminal"] is True
+        assert "July" in agent["text"]
+        assert "$1000.00" in agent["text"]
+
+        assert ws.receive_json()["outcome"] == "promise_made"
+
+    assert mocks.agent_reply.await_count == 1
+
+
+def test_ws_failed_speculative_closing_is_discarded_on_refusal(mocks):
+    """If the speculative TTS of the model's reply fails and the closing
+    differs anyway (refusal), the failure is dropped with the task and the
+    canned closing is still spoken."""
+    canned = "I understand. A specialist will follow up with you. Goodbye."
+    mocks.transcribe_speech.return_value = "No."
+    mocks.agent_reply.return_value = {"reply": "Great, see you Friday.", "is_terminal": True}
+    async def slow_extract(*_args):
+        await asyncio.sleep(0.05)   # let the speculative TTS run and fail first
+        return {"outcome": "refused", "promise_date": None, "promise_amount": None}
+
+    mocks.extract_ptp.side_effect = slow_extract
+
+    async def tts(text, language="English", cache=False):
+        if text == "Great, see you Friday.":
+            raise RuntimeError("TTS down")
+        return b"\x00\x01"
+
+    mocks.synthesize_speech.side_effect = tts
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/session") as ws:
+        ws.send_json({"type": "start", "customer_id": 1, "language": "English"})
+        assert ws.receive_json()["type"] == "agent"  # opening
+
+        ws.send_json({"type": "user_audio", "audio": _audio()})
+        assert ws.receive_json()["type"] == "user"
+        assert ws.receive_json()["text"] == canned
+        assert ws.receive_json()["outcome"] == "refused"
+
+
+def test_discard_task_retrieves_exception_of_finished_task():
+    """cancel() is a no-op on a finished task; _discard_task must still
+    retrieve its exception so asyncio doesn't report it as never retrieved."""
+    async def scenario():
+        reported = []
+        asyncio.get_running_loop().set_exception_handler(lambda _loop, ctx: reported.append(ctx))
+
+        async def boom():
+            raise RuntimeError("TTS down")
+
+        task = asyncio.create_task(boom())
+        await asyncio.sleep(0)
+        assert task.done()
+        _discard_task(task)
+        del task
+        gc.collect()
+        return reported
+
+    assert asyncio.run(scenario()) == []
 
 
 def test_ws_force_close_after_turn_limit(mocks):
@@ -126,6 +245,27 @@ def test_ws_force_close_after_turn_limit(mocks):
     assert mocks.agent_reply.await_count == MAX_CUSTOMER_TURNS - 1
 
 
+def test_ws_opening_tts_failure_still_finalizes_call(mocks):
+    """The call row is written concurrently with the opening line's TTS. If
+    TTS fails first, the INSERT must still complete and the disconnect
+    fallback must finalize that row rather than leave it 'initiated'."""
+    async def slow_create(_call):
+        await asyncio.sleep(0.05)
+        return 42
+
+    mocks.create_call.side_effect = slow_create
+    mocks.synthesize_speech.side_effect = RuntimeError("401 from TTS")
+
+    client = TestClient(app)
+    with client.websocket_connect("/ws/session") as ws:
+        ws.send_json({"type": "start", "customer_id": 1, "language": "English"})
+        err = ws.receive_json()
+        assert err["type"] == "error"
+
+    mocks.complete_call.assert_awaited_once()
+    assert mocks.complete_call.await_args.kwargs["call_id"] == 42
+
+
 def test_ws_unknown_customer_emits_error(mocks):
     """A missing customer raises NotFoundError, which the service turns into the
     protocol error frame rather than crashing the socket."""
@@ -1,36 +1,60 @@
 import io
+import logging
 import os
-from pathlib import Path
+from collections import OrderedDict
 
-from dotenv import load_dotenv
 from elevenlabs.client import AsyncElevenLabs
 
-env_path = Path(__file__).resolve().parent.parent.parent / '.env'
-load_dotenv(dotenv_path=env_path)
+from core.http_client import sdk_client
 
-client = AsyncElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+logger = logging.getLogger(__name__)
+
+# Transcribing a whole customer turn can take far longer than an LLM call, so
+# this keeps the SDK's default 240s, stated here rather than implied.
+get_client = sdk_client(lambda http_client: AsyncElevenLabs(
+    api_key=os.getenv("ELEVENLABS_API_KEY"),
+    httpx_client=http_client,
+    timeout=240,
+))
 
 VOICE_MAPPING = {
     "English": os.getenv("ELEVENLABS_VOICE_ID_EN", "JBFqnCBsd6RMkjVDRZzb"),
     "Spanish": os.getenv("ELEVENLABS_VOICE_ID_ES", "JBFqnCBsd6RMkjVDRZzb"),
 }
 
+# Synthesized audio for lines the caller marks cacheable, keyed by
+# (voice_id, text). Only canned lines that repeat verbatim across sessions are
+# marked, never personalized ones, so the cache holds a handful of short
+# clips and no customer details. Per-process LRU, same trade-off as the
+# session store; the bound is only a backstop.
+SPEECH_CACHE_MAX_ENTRIES = 32
+_speech_cache: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+
 
-async def synthesize_speech(text: str, language: str = "English") -> bytes:
+async def synthesize_speech(text: str, language: str = "English", cache: bool = False) -> bytes:
     """
     Turn agent reply text into audio bytes (mp3).
 
     Args:
         text: The agent's message
         language: "English" or "Spanish" (default: "English")
+        cache: Reuse the audio for identical later requests. Only for fixed
+            lines; personalized text must not be cached.
 
     Returns:
         MP3 audio bytes
     """
     voice_id = VOICE_MAPPING.get(language, VOICE_MAPPING["English"])
-    print(f"[DEBUG] synthesize_speech: language={language}, voice_id={voice_id}, text_len={len(text)}")
+    key = (voice_id, text)
+    cached = _speech_cache.get(key) if cache else None
+    if cached is not None:
+        _speech_cache.move_to_end(key)
+        logger.debug("synthesize_speech: cache hit, language=%s, text_len=%d", language, len(text))
+        return cached
 
-    audio_stream = client.text_to_speech.convert(
+    logger.debug("synthesize_speech: language=%s, voice_id=%s, text_len=%d", language, voice_id, len(text))
+
+    audio_stream = get_client().text_to_speech.convert(
         text=text,
         voice_id=voice_id,
         model_id="eleven_flash_v2_5",
@@ -38,14 +62,20 @@ async def synthesize_speech(text: str, language: str = "English") -> bytes:
     )
     chunks = [chunk async for chunk in audio_stream]
     audio_bytes = b"".join(chunks)
-    print(f"[DEBUG] synthesize_speech: audio_bytes={len(audio_bytes)}")
+    logger.debug("synthesize_speech: audio_bytes=%d", len(audio_bytes))
+
+    # Never cache an empty result — it would replay silence for every later hit.
+    if cache and audio_bytes:
+        _speech_cache[key] = audio_bytes
+        if len(_speech_cache) > SPEECH_CACHE_MAX_ENTRIES:
+            _speech_cache.popitem(last=False)
     return audio_bytes
 
 
 async def transcribe_speech(audio_bytes: bytes) -> str:
     """Transcribe one customer turn (a webm/opus blob from the browser's MediaRecorder)."""
     audio_file = io.BytesIO(audio_bytes)
-    result = await client.speech_to_text.convert(
+    result = await get_client().speech_to_text.convert(
         file=audio_file,
         model_id="scribe_v1",
     )
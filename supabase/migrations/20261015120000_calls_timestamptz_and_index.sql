@@ -0,0 +1,14 @@
+-- Existing values were written in UTC (server default / datetime.utcnow()).
+-- initiated_at becomes NOT NULL: call history pages on it, and a NULL would
+-- drop the row out of every keyset comparison. Any NULLs are backfilled first.
+update calls set initiated_at = coalesce(completed_at, now() at time zone 'UTC')
+  where initiated_at is null;
+
+alter table calls
+  alter column initiated_at type timestamptz using initiated_at at time zone 'UTC',
+  alter column initiated_at set default now(),
+  alter column initiated_at set not null,
+  alter column completed_at type timestamptz using completed_at at time zone 'UTC';
+
+-- Call history is always read newest-first.
+create index if not exists calls_initiated_at_idx on calls (initiated_at desc, id desc);